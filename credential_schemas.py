@@ -1,8 +1,24 @@
+import copy
 import os
+import sys
 import json
+import threading
+import time
 import requests
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import yaml
-from typing import List, Dict
+try:
+    # libyaml-backed loader/dumper, typically 5-10x faster than pure Python
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from urllib3.util.retry import Retry
+from typing import List, Dict, Optional
 from pathlib import Path
 
 def print_success(message: str) -> None:
@@ -21,6 +37,21 @@ def ensure_directory_exists(path: str) -> None:
     """Ensure that a directory exists, create it if it doesn't"""
     Path(path).mkdir(parents=True, exist_ok=True)
 
+def _dumps_json(obj: Dict) -> bytes:
+    """Serialize to pretty-printed JSON bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _loads_json(data: bytes) -> Dict:
+    """Parse JSON bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Directory holding the downloaded schema files
+SCHEMA_DIR: Path = Path("credential_schemas")
+
 # Known credential types from our workflows
 CREDENTIAL_TYPES = [
     "telegramApi",
@@ -29,89 +60,316 @@ CREDENTIAL_TYPES = [
     "httpHeaderAuth"
 ]
 
+# Shared session so concurrent schema fetches reuse pooled TCP/TLS connections
+# and transparently retry transient gateway errors
+SESSION = requests.Session()
+_ADAPTER = requests.adapters.HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+# (connect, read) timeout applied to every schema request
+REQUEST_TIMEOUT = (3, 10)
+
+# Disk copies older than this are refreshed in the background when served
+SCHEMA_MAX_AGE_SECONDS = 24 * 3600
+
+# Example values emitted per JSON schema field type; mutable types use
+# factories so every field gets its own fresh instance
+_EXAMPLE_BY_TYPE = {
+    "string": "example_string_value",
+    "number": 0,
+    "boolean": False
+}
+_EXAMPLE_FACTORIES = {
+    "array": list,
+    "object": dict
+}
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Dict:
+    """Parse a YAML file, memoized on (path, mtime).
+
+    The mtime argument exists purely as a cache key: as long as the file
+    is unchanged, repeated calls skip the parse entirely.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 def load_servers() -> Dict:
     """Load server configurations from servers.yaml"""
     try:
-        with open('servers.yaml', 'r') as f:
-            config = yaml.safe_load(f)
-            return config.get('servers', {})
+        config = _load_yaml_cached('servers.yaml', os.stat('servers.yaml').st_mtime_ns)
+        return config.get('servers', {})
     except Exception as e:
         print_error(f"Error loading servers.yaml: {str(e)}")
         return {}
 
-def select_server(servers: Dict) -> Dict:
-    """Let user select a server from the available options"""
+def _prompt_choice(prompt: str, hi: int) -> Optional[int]:
+    """Prompt for a menu choice between 1 and hi.
+
+    Returns the parsed choice, or None when the input is not a number in
+    range. Validates with str.isdigit so a typo never pays for the
+    ValueError raise/catch machinery.
+    """
+    raw = input(prompt).strip()
+    if not raw.isdigit():
+        print_error("Please enter a valid number.")
+        return None
+    choice = int(raw)
+    if 1 <= choice <= hi:
+        return choice
+    print_error("Invalid selection. Please try again.")
+    return None
+
+def select_server(servers: Dict, default: Dict = None) -> Dict:
+    """Let user select a server from the available options.
+
+    When a default is given, pressing Enter keeps it instead of forcing
+    a re-selection.
+    """
     if not servers:
         print_error("No servers found in servers.yaml")
         exit(1)
-    
+
+    server_ids = list(servers)
     print("\nAvailable servers:")
-    for idx, (server_id, server) in enumerate(servers.items(), 1):
-        print(f"{idx}. {server['name']} ({server_id})")
-    
+    for idx, server_id in enumerate(server_ids, 1):
+        print(f"{idx}. {servers[server_id]['name']} ({server_id})")
+
+    if default is not None:
+        prompt = f"\nSelect a server (enter number, Enter for {default['name']}): "
+    else:
+        prompt = "\nSelect a server (enter number): "
+
     while True:
-        try:
-            choice = int(input("\nSelect a server (enter number): "))
-            if 1 <= choice <= len(servers):
-                server_id = list(servers.keys())[choice - 1]
-                return servers[server_id]
-            print_error("Invalid selection. Please try again.")
-        except ValueError:
-            print_error("Please enter a valid number.")
+        raw = input(prompt).strip()
+        if not raw and default is not None:
+            return default
+        if raw.isdigit() and 1 <= int(raw) <= len(server_ids):
+            return servers[server_ids[int(raw) - 1]]
+        print_error("Invalid selection. Please try again.")
+
+def _schema_url_prefix(base_url: str) -> str:
+    """Build the schema endpoint prefix for a server once per batch"""
+    return f"{base_url.rstrip('/')}/api/v1/credentials/schema/"
+
+# Sidecar mapping cred_type -> last seen ETag, used for conditional GETs
+_ETAG_FILE = SCHEMA_DIR / ".etags.json"
+_ETAG_LOCK = threading.Lock()
+
+def _load_etags() -> Dict:
+    """Load the ETag sidecar, returning an empty map when absent/corrupt"""
+    try:
+        with open(_ETAG_FILE, 'rb') as f:
+            return _loads_json(f.read())
+    except Exception:
+        return {}
+
+def _store_etag(cred_type: str, etag: str) -> None:
+    """Record the ETag for one schema in the sidecar file"""
+    with _ETAG_LOCK:
+        etags = _load_etags()
+        etags[cred_type] = etag
+        tmp_file = f"{_ETAG_FILE}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(_dumps_json(etags))
+        os.replace(tmp_file, _ETAG_FILE)
+
+def _fetch_and_store_schema(cred_type: str, schema_prefix: str) -> bool:
+    """Fetch one credential schema and write it to disk.
+
+    Runs inside a worker thread so the disk write of one schema overlaps
+    the network fetches of the others. The schema is serialized to a single
+    string first and written with one call instead of json.dump's many
+    small writes. Authentication comes from the shared session headers.
+
+    Sends If-None-Match with the last known ETag when a local copy exists;
+    returns False when the server answered 304 and the file was left
+    untouched, True when a fresh copy was written.
+    """
+    schema_file = SCHEMA_DIR / f"{cred_type}.json"
+
+    headers = {}
+    etag = _load_etags().get(cred_type)
+    if etag and os.path.exists(schema_file):
+        headers["If-None-Match"] = etag
+
+    response = SESSION.get(schema_prefix + cred_type, headers=headers,
+                           timeout=REQUEST_TIMEOUT)
+
+    if response.status_code == 304:
+        return False
+    if response.status_code != 200:
+        raise RuntimeError(f"status {response.status_code}")
+
+    # Parse the raw bytes directly: response.json() would decode to str
+    # first and then run the slower stdlib parser over it
+    schema = _loads_json(response.content)
+    _store_schema(cred_type, schema)
+
+    new_etag = response.headers.get("ETag")
+    if new_etag:
+        _store_etag(cred_type, new_etag)
+    return True
+
+def _store_schema(cred_type: str, schema: Dict) -> None:
+    """Write one schema to disk atomically.
+
+    Writes to a temp path and renames so concurrent readers (lazy
+    get_schema, background refreshes) never observe a partial file.
+    """
+    schema_file = SCHEMA_DIR / f"{cred_type}.json"
+    tmp_file = f"{schema_file}.tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(_dumps_json(schema))
+    os.replace(tmp_file, schema_file)
+
+def _fetch_schemas_batch(base_url: str, types: List[str]) -> Dict:
+    """Try to fetch several schemas with a single batch request.
+
+    Returns a mapping of cred_type -> schema when the server supports the
+    batch endpoint, or None when it doesn't (404/405/any failure) and the
+    caller should fall back to per-type GETs.
+    """
+    try:
+        response = SESSION.post(
+            f"{base_url.rstrip('/')}/api/v1/credentials/schema:batch",
+            json={"types": types},
+            timeout=REQUEST_TIMEOUT
+        )
+        if response.status_code != 200:
+            return None
+        payload = _loads_json(response.content)
+    except Exception:
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+    return {t: payload[t] for t in types if t in payload}
 
 def get_credential_schemas(api_key: str, base_url: str) -> None:
     """Fetch and store credential schemas for known credential types"""
-    headers = {"X-N8N-API-KEY": api_key}
-    
+    SESSION.headers.update({"X-N8N-API-KEY": api_key})
+    schema_prefix = _schema_url_prefix(base_url)
+
     print("\nFetching credential schemas...")
-    ensure_directory_exists("credential_schemas")
-    
-    for cred_type in CREDENTIAL_TYPES:
+    ensure_directory_exists(SCHEMA_DIR)
+
+    # One batch request beats N round-trips when the server supports it
+    batch = _fetch_schemas_batch(base_url, CREDENTIAL_TYPES)
+    if batch:
+        for cred_type, schema in batch.items():
+            _store_schema(cred_type, schema)
+            print_success(f"  ✓ Saved schema for {cred_type}")
+        for cred_type in CREDENTIAL_TYPES:
+            if cred_type not in batch:
+                print_error(f"  ✗ Batch response missing schema for {cred_type}")
+        return
+
+    # Fetch all schemas concurrently: total wall time is roughly the slowest
+    # single request instead of the sum of all request latencies
+    with ThreadPoolExecutor(max_workers=len(CREDENTIAL_TYPES)) as executor:
+        futures = {
+            executor.submit(_fetch_and_store_schema, cred_type, schema_prefix): cred_type
+            for cred_type in CREDENTIAL_TYPES
+        }
+
+        for future in as_completed(futures):
+            cred_type = futures[future]
+            try:
+                if future.result():
+                    print_success(f"  ✓ Saved schema for {cred_type}")
+                else:
+                    print_success(f"  ✓ Unchanged: {cred_type}")
+            except Exception as e:
+                print_error(f"  ✗ Error fetching schema for {cred_type}: {str(e)}")
+
+def _refresh_schema(cred_type: str, api_key: str, base_url: str) -> None:
+    """Best-effort background refresh of one schema; the stale disk copy
+    stays usable if the fetch fails."""
+    try:
+        SESSION.headers.update({"X-N8N-API-KEY": api_key})
+        _fetch_and_store_schema(cred_type, _schema_url_prefix(base_url))
+    except Exception:
+        pass
+
+@lru_cache(maxsize=64)
+def _read_schema(cred_type: str, mtime_ns: int) -> Dict:
+    """Open and parse a schema file, memoized on (cred_type, mtime)."""
+    schema_file = SCHEMA_DIR / f"{cred_type}.json"
+    with open(schema_file, 'rb') as f:
+        return _loads_json(f.read())
+
+def get_schema(cred_type: str, api_key: str = None, base_url: str = None) -> Dict:
+    """Get a credential schema, fetching it on demand when possible.
+
+    A disk copy is always served immediately; if it is older than
+    SCHEMA_MAX_AGE_SECONDS and server details are provided, a background
+    refresh is started (stale-while-revalidate). With no disk copy and
+    server details given, the schema is fetched synchronously.
+    """
+    schema_file = SCHEMA_DIR / f"{cred_type}.json"
+
+    if not os.path.exists(schema_file) and api_key and base_url:
         try:
-            response = requests.get(
-                f"{base_url}/api/v1/credentials/schema/{cred_type}",
-                headers=headers
-            )
-            
-            if response.status_code == 200:
-                schema = response.json()
-                
-                # Save schema to file
-                schema_file = os.path.join("credential_schemas", f"{cred_type}.json")
-                with open(schema_file, 'w', encoding='utf-8') as f:
-                    json.dump(schema, f, indent=2)
-                print_success(f"  ✓ Saved schema for {cred_type}")
-            else:
-                print_error(f"  ✗ Failed to get schema for {cred_type}: {response.status_code}")
-                
+            ensure_directory_exists(SCHEMA_DIR)
+            SESSION.headers.update({"X-N8N-API-KEY": api_key})
+            _fetch_and_store_schema(cred_type, _schema_url_prefix(base_url))
         except Exception as e:
-            print_error(f"  ✗ Error fetching schema for {cred_type}: {str(e)}")
+            print_error(f"Error fetching schema for {cred_type}: {str(e)}")
+            return {}
 
-def get_schema(cred_type: str) -> Dict:
-    """Get a credential schema from file"""
-    schema_file = os.path.join("credential_schemas", f"{cred_type}.json")
     try:
-        with open(schema_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        stat = os.stat(schema_file)
+        if (api_key and base_url and
+                time.time() - stat.st_mtime > SCHEMA_MAX_AGE_SECONDS):
+            threading.Thread(
+                target=_refresh_schema,
+                args=(cred_type, api_key, base_url),
+                daemon=True
+            ).start()
+
+        return _read_schema(cred_type, stat.st_mtime_ns)
     except Exception as e:
         print_error(f"Error loading schema for {cred_type}: {str(e)}")
         return {}
 
 def list_available_schemas() -> List[str]:
     """List all available credential schemas"""
-    schema_dir = "credential_schemas"
-    if not os.path.exists(schema_dir):
+    try:
+        with os.scandir(SCHEMA_DIR) as entries:
+            return [entry.name[:-5] for entry in entries
+                    if entry.is_file() and entry.name.endswith('.json')
+                    and not entry.name.startswith('.')]
+    except FileNotFoundError:
         return []
-    
-    return [f.replace('.json', '') for f in os.listdir(schema_dir) 
-            if f.endswith('.json')]
 
 def generate_credential_example(schema: Dict, cred_type: str) -> Dict:
     """Generate an example credential configuration based on the schema"""
     # Create a credential ID based on the type
     cred_id = cred_type.lower()
-    
-    example = {
+
+    # Build the example data once, then hand it to both environments
+    data = {}
+    for field, props in schema.get("properties", {}).items():
+        field_type = props.get("type", "string")
+        description = props.get("description", "")
+
+        # Generate example value based on field type
+        if field_type in _EXAMPLE_FACTORIES:
+            data[field] = _EXAMPLE_FACTORIES[field_type]()
+        else:
+            data[field] = _EXAMPLE_BY_TYPE.get(field_type, "example_value")
+
+        # Add description as comment if available
+        if description:
+            data[f"# {field}"] = description
+
+    return {
         "environments": {
             "production": {
                 "name": "Production Environment",
@@ -120,7 +378,7 @@ def generate_credential_example(schema: Dict, cred_type: str) -> Dict:
                     cred_id: {
                         "type": cred_type,
                         "name": f"Example {cred_type} Credential",
-                        "data": {}
+                        "data": data
                     }
                 }
             },
@@ -131,44 +389,15 @@ def generate_credential_example(schema: Dict, cred_type: str) -> Dict:
                     cred_id: {
                         "type": cred_type,
                         "name": f"Example {cred_type} Credential",
-                        "data": {}
+                        # Deep copy: a shallow one would share the list/
+                        # dict instances between environments and make
+                        # PyYAML render them as anchors/aliases
+                        "data": copy.deepcopy(data)
                     }
                 }
             }
         }
     }
-    
-    # Extract all fields from schema properties
-    if "properties" in schema:
-        for field, props in schema["properties"].items():
-            # Get field type and description
-            field_type = props.get("type", "string")
-            description = props.get("description", "")
-            
-            # Generate example value based on field type
-            if field_type == "string":
-                example_value = "example_string_value"
-            elif field_type == "number":
-                example_value = 0
-            elif field_type == "boolean":
-                example_value = False
-            elif field_type == "array":
-                example_value = []
-            elif field_type == "object":
-                example_value = {}
-            else:
-                example_value = "example_value"
-            
-            # Add field to both environments
-            example["environments"]["production"]["credentials"][cred_id]["data"][field] = example_value
-            example["environments"]["development"]["credentials"][cred_id]["data"][field] = example_value
-            
-            # Add description as comment if available
-            if description:
-                example["environments"]["production"]["credentials"][cred_id]["data"][f"# {field}"] = description
-                example["environments"]["development"]["credentials"][cred_id]["data"][f"# {field}"] = description
-    
-    return example
 
 def show_credential_examples() -> None:
     """Show example credential configurations for available schemas"""
@@ -182,48 +411,109 @@ def show_credential_examples() -> None:
         print(f"{idx}. {schema}")
     
     while True:
-        try:
-            choice = int(input("\nSelect a credential type to view example (enter number): "))
-            if 1 <= choice <= len(schemas):
-                cred_type = schemas[choice - 1]
-                schema = get_schema(cred_type)
-                if schema:
-                    example = generate_credential_example(schema, cred_type)
-                    print_info(f"\nExample credential configuration for {cred_type}:")
-                    print("\nCopy this into your credentials.yaml:")
-                    print("---")
-                    print(yaml.dump(example, default_flow_style=False, sort_keys=False))
-                    return
-            print_error("Invalid selection. Please try again.")
-        except ValueError:
-            print_error("Please enter a valid number.")
+        choice = _prompt_choice("\nSelect a credential type to view example (enter number): ", len(schemas))
+        if choice is None:
+            continue
+
+        cred_type = schemas[choice - 1]
+        schema = get_schema(cred_type)
+        if schema:
+            example = generate_credential_example(schema, cred_type)
+            print_info(f"\nExample credential configuration for {cred_type}:")
+            print("\nCopy this into your credentials.yaml:")
+            print("---")
+            # Stream tokens straight to stdout instead of building
+            # the whole document as one string first
+            yaml.dump(example, sys.stdout, Dumper=_YamlDumper,
+                      default_flow_style=False, sort_keys=False)
+            return
+
+# Background prefetch state: at most one warm-up per selected server
+_PREFETCH = {"key": None, "thread": None}
+
+# Server used by the last download, offered as the default next time
+_LAST_SERVER = {"server": None}
+
+def _prefetch_worker(api_key: str, base_url: str) -> None:
+    """Quietly warm the on-disk schema cache for a server"""
+    try:
+        ensure_directory_exists(SCHEMA_DIR)
+        SESSION.headers.update({"X-N8N-API-KEY": api_key})
+        schema_prefix = _schema_url_prefix(base_url)
+        for cred_type in CREDENTIAL_TYPES:
+            try:
+                _fetch_and_store_schema(cred_type, schema_prefix)
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+def _start_prefetch(server: Dict) -> None:
+    """Start a background schema download for a newly selected server.
+
+    Idempotent per server: selecting the same server again does not
+    refetch while a warm-up is running or already finished.
+    """
+    key = (server['api_key'], server['url'])
+    if _PREFETCH["key"] != key:
+        thread = threading.Thread(target=_prefetch_worker, args=key, daemon=True)
+        _PREFETCH["key"] = key
+        _PREFETCH["thread"] = thread
+        thread.start()
+
+def _do_download() -> None:
+    """Handle the download-schemas menu option.
+
+    The server is chosen on every invocation so one session can download
+    from several servers; the previously used (prefetched) one is offered
+    as the default.
+    """
+    selected_server = select_server(load_servers(), default=_LAST_SERVER["server"])
+    _LAST_SERVER["server"] = selected_server
+    print(f"\nUsing server: {selected_server['name']}")
+
+    # Give any in-flight prefetch for this server a bounded head start;
+    # the visible fetch below then mostly turns into cheap 304s against
+    # the warmed cache, and a stalled prefetch cannot hang the menu
+    thread = _PREFETCH["thread"]
+    if (thread is not None and thread.is_alive()
+            and _PREFETCH["key"] == (selected_server['api_key'], selected_server['url'])):
+        print_info("Waiting for background schema download to finish...")
+        thread.join(timeout=sum(REQUEST_TIMEOUT))
+
+    get_credential_schemas(selected_server['api_key'], selected_server['url'])
 
 def main_menu() -> None:
     """Display and handle the main menu"""
+    servers = load_servers()
+    if servers:
+        # Warm the schema cache for the first configured server while the
+        # user reads the menu; _do_download offers it as the default but
+        # every download re-prompts, so the session is never locked to it
+        default_server = servers[next(iter(servers))]
+        _LAST_SERVER["server"] = default_server
+        _start_prefetch(default_server)
+
+    actions = {
+        1: _do_download,
+        2: show_credential_examples
+    }
+
     while True:
         print("\nCredential Schema Management")
         print("1. Download credential schemas from server")
         print("2. View example credential configurations")
         print("3. Exit")
-        
-        try:
-            choice = int(input("\nSelect an option (enter number): "))
-            if choice == 1:
-                servers = load_servers()
-                selected_server = select_server(servers)
-                api_key = selected_server['api_key']
-                base_url = selected_server['url']
-                print(f"\nUsing server: {selected_server['name']}")
-                get_credential_schemas(api_key, base_url)
-            elif choice == 2:
-                show_credential_examples()
-            elif choice == 3:
-                print_info("Goodbye!")
-                break
-            else:
-                print_error("Invalid selection. Please try again.")
-        except ValueError:
-            print_error("Please enter a valid number.")
+
+        choice = _prompt_choice("\nSelect an option (enter number): ", 3)
+        if choice is None:
+            continue
+
+        if choice == 3:
+            print_info("Goodbye!")
+            break
+
+        actions[choice]()
 
 if __name__ == "__main__":
     main_menu()
@@ -1,12 +1,292 @@
 from typing import List, Dict, Optional, Tuple
+import argparse
 import requests
+from urllib3.util.retry import Retry
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+import threading
 import os
 from dotenv import load_dotenv
+from functools import lru_cache
 import yaml
+try:
+    # libyaml-backed loader, typically ~10x faster than pure Python
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import re
 from pathlib import Path
 from datetime import datetime
 import sys
+import time
+
+# Shared HTTP session: connection pooling and keep-alive amortize the
+# TCP/TLS handshake across all API calls of a run, with automatic retry
+# of transient server errors
+SESSION = requests.Session()
+_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    backoff_jitter=0.25,
+    status_forcelist=[429, 500, 502, 503, 504],
+    # POST is deliberately absent: a gateway 502/504 can arrive after the
+    # origin already processed the create, so an automatic re-POST would
+    # silently duplicate workflows/credentials. GET/PUT/DELETE are
+    # idempotent against this API and safe to replay.
+    allowed_methods={"GET", "PUT", "DELETE"},
+    respect_retry_after_header=True
+)
+_ADAPTER = requests.adapters.HTTPAdapter(pool_maxsize=64, max_retries=_RETRY)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+# Concurrency cap for parallel create/delete calls against one instance
+MAX_WORKERS = 8
+
+# (connect, read) timeout for every API call: a stalled instance fails
+# fast and counts as a failure instead of blocking the CLI indefinitely
+TIMEOUT = (3.05, 30)
+
+# Serializes resource_mapping.json updates from worker threads
+_RESOURCE_MAPPING_LOCK = threading.Lock()
+
+# Short-lived cache for idempotent list GETs (projects, workflows) so
+# re-running an operation in the same session skips the round-trip
+_GET_CACHE: Dict = {}
+GET_CACHE_TTL_SECONDS = 60.0
+
+def _cached_get(url: str, headers: Dict, params: Optional[Dict] = None,
+                refresh: bool = False) -> requests.Response:
+    """GET with a short TTL cache keyed on URL, params, and API key.
+
+    Args:
+        url (str): The URL to request.
+        headers (Dict): Request headers (the API key is part of the cache key).
+        params (Optional[Dict]): Query parameters.
+        refresh (bool): When True, bypass the cache and refetch.
+
+    Returns:
+        requests.Response: The (possibly cached) response.
+    """
+    cache_key = (url, tuple(sorted((params or {}).items())),
+                 headers.get("X-N8N-API-KEY"))
+
+    if not refresh:
+        hit = _GET_CACHE.get(cache_key)
+        if hit is not None and time.monotonic() - hit[0] < GET_CACHE_TTL_SECONDS:
+            return hit[1]
+
+    response = SESSION.get(url, headers=headers, params=params, timeout=TIMEOUT)
+    if response.status_code == 200:
+        _GET_CACHE[cache_key] = (time.monotonic(), response)
+    return response
+
+def clear_get_cache() -> None:
+    """Drop all cached list responses, forcing the next GETs to refetch."""
+    _GET_CACHE.clear()
+
+# Whether an instance exposes the bulk-delete endpoint, keyed by
+# (base_url, kind); probed at most once per run
+_BULK_SUPPORTED: Dict = {}
+
+class ApiClient:
+    """Per-server API handle with headers and URL prefixes built once.
+
+    The module-level helpers rebuild the auth header dict and endpoint
+    f-strings on every call; in the hot create/delete loops that adds up
+    to thousands of small allocations. An instance bakes base_url and
+    api_key into attribute state and reuses the shared pooled SESSION.
+    """
+
+    def __init__(self, base_url: str, api_key: str) -> None:
+        self.base_url = base_url
+        self.headers = {"X-N8N-API-KEY": api_key}
+        self.workflows_url = f"{base_url}/api/v1/workflows"
+        self.credentials_url = f"{base_url}/api/v1/credentials"
+        self.projects_url = f"{base_url}/api/v1/projects"
+
+    def probe(self) -> requests.Response:
+        """Cheap connectivity check: ask for a single workflow."""
+        return SESSION.get(self.workflows_url, headers=self.headers,
+                           params={"limit": 1}, timeout=5)
+
+    def get_workflow(self, workflow_id: str) -> requests.Response:
+        """Fetch one workflow by ID."""
+        return SESSION.get(f"{self.workflows_url}/{workflow_id}", headers=self.headers, timeout=TIMEOUT)
+
+    def get_credentials(self) -> List[Dict]:
+        """List all credentials on the instance.
+
+        Raises:
+            Exception: If the credentials retrieval fails.
+        """
+        response = SESSION.get(self.credentials_url, headers=self.headers, timeout=TIMEOUT)
+        if response.status_code != 200:
+            raise Exception(f"Failed to get credentials: {response.text}")
+        return _json_loads(response.content)['data']
+
+    def delete_workflow(self, workflow_id: str) -> None:
+        """Delete one workflow.
+
+        Raises:
+            Exception: If the workflow deletion fails.
+        """
+        response = SESSION.delete(f"{self.workflows_url}/{workflow_id}", headers=self.headers, timeout=TIMEOUT)
+        if response.status_code != 200:
+            raise Exception(f"Failed to delete workflow: {response.text}")
+
+    def delete_credential(self, credential_id: str) -> None:
+        """Delete one credential.
+
+        Raises:
+            Exception: If the credential deletion fails.
+        """
+        response = SESSION.delete(f"{self.credentials_url}/{credential_id}", headers=self.headers, timeout=TIMEOUT)
+        if response.status_code != 200:
+            raise Exception(f"Failed to delete credential: {response.text}")
+
+    def delete_project(self, project_id: str) -> None:
+        """Delete one project.
+
+        Raises:
+            Exception: If the project deletion fails.
+        """
+        response = SESSION.delete(f"{self.projects_url}/{project_id}", headers=self.headers, timeout=TIMEOUT)
+        if response.status_code != 200:
+            raise Exception(f"Failed to delete project: {response.text}")
+
+    def bulk_delete(self, ids: List[str], kind: str) -> Tuple[set, Dict[str, str]]:
+        """Delete many resources, preferring one bulk call over N deletes.
+
+        Tries POST {base_url}/api/v1/{kind}/bulk-delete once; when the
+        endpoint is missing (404/405) that is remembered per instance and
+        deletion falls back to concurrent per-ID calls.
+
+        Args:
+            ids (List[str]): Resource IDs to delete.
+            kind (str): Resource collection ('workflows' or 'credentials').
+
+        Returns:
+            Tuple[set, Dict[str, str]]: Deleted IDs, and failure reasons by ID.
+        """
+        deleted: set = set()
+        failed: Dict[str, str] = {}
+        if not ids:
+            return deleted, failed
+
+        support_key = (self.base_url, kind)
+        if _BULK_SUPPORTED.get(support_key, True):
+            try:
+                response = SESSION.post(
+                    f"{self.base_url}/api/v1/{kind}/bulk-delete",
+                    headers={**self.headers, "Content-Type": "application/json"},
+                    data=_json_dumps_bytes({"ids": list(ids)}),
+                    timeout=TIMEOUT
+                )
+                if response.status_code in (200, 204):
+                    _BULK_SUPPORTED[support_key] = True
+                    return set(ids), failed
+                if response.status_code in (404, 405):
+                    _BULK_SUPPORTED[support_key] = False
+            except Exception:
+                # Treat transport errors like an unsupported endpoint and
+                # let the per-ID path report individual failures
+                pass
+
+        delete_one = self.delete_workflow if kind == 'workflows' else self.delete_credential
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            futures = {pool.submit(delete_one, resource_id): resource_id for resource_id in ids}
+            for future in as_completed(futures):
+                resource_id = futures[future]
+                try:
+                    future.result()
+                    deleted.add(resource_id)
+                except Exception as e:
+                    failed[resource_id] = str(e)
+        return deleted, failed
+
+@lru_cache(maxsize=8)
+def _api_client(base_url: str, api_key: str) -> ApiClient:
+    """Return the ApiClient for a server, built once per (url, key) pair."""
+    return ApiClient(base_url, api_key)
+
+def _json_dumps_str(obj) -> str:
+    """Serialize an object to a JSON string, via orjson when available.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        str: The serialized JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+def _json_loads(data):
+    """Parse a JSON document, via orjson when available.
+
+    Args:
+        data: JSON document as str or bytes.
+
+    Returns:
+        The parsed object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Serialize an object to compact JSON bytes, via orjson when available.
+
+    Used to pre-encode request bodies so requests does not fall back to
+    stdlib json for large workflow payloads.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        bytes: The serialized JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _json_dumps_pretty(obj) -> bytes:
+    """Serialize to pretty-printed JSON bytes, via orjson when available.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        bytes: The serialized document with 2-space indentation.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _json_deepcopy(obj: Dict) -> Dict:
+    """Deep-copy a JSON-compatible object via a serialization round-trip.
+
+    Args:
+        obj (Dict): JSON-compatible object to copy.
+
+    Returns:
+        Dict: An independent copy of the object.
+    """
+    if orjson is not None:
+        return orjson.loads(orjson.dumps(obj))
+    return json.loads(json.dumps(obj))
+
+# ANSI colors only help on a real terminal; redirected output gets plain
+# text that stays grep-able and avoids escape codes in log files
+_IS_TTY = sys.stdout.isatty()
 
 def print_summary(message: str) -> None:
     """Print a summary header in blue color.
@@ -14,7 +294,10 @@ def print_summary(message: str) -> None:
     Args:
         message (str): The message to display as a summary header.
     """
-    print(f"\n\033[94m=== {message} ===\033[0m")
+    if _IS_TTY:
+        print(f"\n\033[94m=== {message} ===\033[0m")
+    else:
+        print(f"\n=== {message} ===")
 
 def print_success(message: str) -> None:
     """Print a success message in green color.
@@ -22,7 +305,10 @@ def print_success(message: str) -> None:
     Args:
         message (str): The success message to display.
     """
-    print(f"\033[92m✓ {message}\033[0m")
+    if _IS_TTY:
+        print(f"\033[92m✓ {message}\033[0m")
+    else:
+        print(f"✓ {message}")
 
 def print_error(message: str) -> None:
     """Print an error message in red color.
@@ -30,7 +316,47 @@ def print_error(message: str) -> None:
     Args:
         message (str): The error message to display.
     """
-    print(f"\033[91m✗ {message}\033[0m")
+    if _IS_TTY:
+        print(f"\033[91m✗ {message}\033[0m")
+    else:
+        print(f"✗ {message}")
+
+@lru_cache(maxsize=4)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Dict:
+    """Parse a YAML file, memoized on (path, mtime).
+
+    Args:
+        path (str): Path of the YAML file to parse.
+        mtime_ns (int): Modification time of the file, used as cache key.
+
+    Returns:
+        Dict: The parsed YAML document.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+def load_credentials_config() -> Dict:
+    """Load credentials.yaml, re-parsing only when the file changed.
+
+    Returns:
+        Dict: The parsed credentials configuration.
+    """
+    return _load_yaml_cached('credentials.yaml', os.stat('credentials.yaml').st_mtime_ns)
+
+def get_all_postfixes(creds_config: Dict) -> List[str]:
+    """Collect the environment postfixes from a credentials configuration.
+
+    Args:
+        creds_config (Dict): Parsed credentials configuration.
+
+    Returns:
+        List[str]: All non-empty environment postfixes.
+    """
+    return [
+        env.get('postfix', '').strip()
+        for env in creds_config.get('environments', {}).values()
+        if env.get('postfix', '').strip()
+    ]
 
 def get_all_projects(api_key: str, base_url: str) -> List[Dict]:
     """Get all available projects from n8n instance.
@@ -44,9 +370,9 @@ def get_all_projects(api_key: str, base_url: str) -> List[Dict]:
     """
     headers = {"X-N8N-API-KEY": api_key}
     try:
-        response = requests.get(f"{base_url}/api/v1/projects", headers=headers)
+        response = _cached_get(f"{base_url}/api/v1/projects", headers)
         if response.status_code == 200:
-            return response.json().get('data', [])
+            return _json_loads(response.content).get('data', [])
         elif response.status_code == 403:
             print_error("Project listing not allowed, probably on local instance.")
             return []
@@ -73,10 +399,11 @@ def create_project(api_key: str, base_url: str, name: str) -> Optional[str]:
         "Content-Type": "application/json"
     }
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{base_url}/api/v1/projects",
             headers=headers,
-            json={"name": name}
+            data=_json_dumps_bytes({"name": name}),
+            timeout=TIMEOUT
         )
         
         if response.status_code in [200, 201]:
@@ -90,7 +417,9 @@ def create_project(api_key: str, base_url: str, name: str) -> Optional[str]:
         print_error(f"Error creating project: {str(e)}")
         return None
 
-def create_credential(api_key: str, base_url: str, credential_data: Dict, credential_type: str, env_postfix: str = "") -> Optional[str]:
+def create_credential(api_key: str, base_url: str, credential_data: Dict, credential_type: str, env_postfix: str = "",
+                      all_postfixes: Optional[List[str]] = None,
+                      mapping_store: Optional["ResourceMappingStore"] = None) -> Optional[str]:
     """Create a new credential in n8n instance.
 
     Args:
@@ -99,6 +428,10 @@ def create_credential(api_key: str, base_url: str, credential_data: Dict, creden
         credential_data (Dict): Dictionary containing credential information.
         credential_type (str): Type of the credential to create.
         env_postfix (str): Environment postfix to append to credential name.
+        all_postfixes (Optional[List[str]]): Known environment postfixes to strip
+            from the credential name. Loaded from credentials.yaml when omitted.
+        mapping_store (Optional[ResourceMappingStore]): Buffer for the resource
+            mapping entry. Written straight to disk when omitted.
 
     Returns:
         Optional[str]: The ID of the created credential if successful, None otherwise.
@@ -110,24 +443,17 @@ def create_credential(api_key: str, base_url: str, credential_data: Dict, creden
     }
 
     # Get all possible postfixes from environments
-    try:
-        with open('credentials.yaml', 'r') as f:
-            creds_config = yaml.safe_load(f)
-            all_postfixes = [
-                env.get('postfix', '').strip()
-                for env in creds_config.get('environments', {}).values()
-                if env.get('postfix', '').strip()
-            ]
-    except Exception as e:
-        print_error(f"Warning: Could not load postfixes from credentials.yaml: {str(e)}")
-        all_postfixes = []
+    if all_postfixes is None:
+        try:
+            all_postfixes = get_all_postfixes(load_credentials_config())
+        except Exception as e:
+            print_error(f"Warning: Could not load postfixes from credentials.yaml: {str(e)}")
+            all_postfixes = []
 
     # Clean the credential name and remove any existing postfix
     name = credential_data["name"].strip()
-    for postfix in all_postfixes:
-        if name.endswith(f" {postfix}"):
-            name = name[:-len(f" {postfix}")].strip()
-            break
+    if all_postfixes:
+        name = _postfix_pattern(tuple(all_postfixes)).sub('', name)
 
     # Add new postfix if provided
     if env_postfix:
@@ -140,11 +466,14 @@ def create_credential(api_key: str, base_url: str, credential_data: Dict, creden
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload)
+        response = SESSION.post(url, headers=headers, data=_json_dumps_bytes(payload), timeout=TIMEOUT)
         
         if response.status_code == 200:
             credential = response.json()
-            save_resource_mapping(base_url, 'credentials', credential['id'], credential['name'])
+            if mapping_store is not None:
+                mapping_store.add(base_url, 'credentials', credential['id'], credential['name'])
+            else:
+                save_resource_mapping(base_url, 'credentials', credential['id'], credential['name'])
             print_success(f"Created credential: {credential['name']}")
             return credential['id']
         else:
@@ -169,13 +498,11 @@ def get_workflows(api_key: str, base_url: str, project_id: Optional[str]) -> Lis
     headers = {"X-N8N-API-KEY": api_key}
     try:
         params = {"projectId": project_id} if project_id else {}
-        response = requests.get(
-            f"{base_url}/api/v1/workflows",
-            headers=headers,
-            params=params
-        )
+        response = _cached_get(f"{base_url}/api/v1/workflows", headers, params)
         if response.status_code == 200:
-            return response.json().get('data', [])
+            # Full-project listings can be MBs of JSON; decode the raw
+            # bytes with orjson instead of response.json()'s stdlib parse
+            return _json_loads(response.content).get('data', [])
         else:
             print_error(f"Failed to get workflows: {response.status_code}")
             return []
@@ -207,9 +534,68 @@ def get_environment_replacements(creds_config: Dict, env_type: str) -> Dict[str,
             
     return replacements
 
+def build_credential_index(credential_mapping: Dict) -> Dict[str, str]:
+    """Index credential IDs by normalized base name.
+
+    Turns the per-node scan over the whole credential mapping into a
+    single hash lookup. Both the lowercased first token of each mapping
+    key and its underscore-to-space variant are indexed.
+
+    Args:
+        credential_mapping (Dict): Dictionary mapping credential names to IDs.
+
+    Returns:
+        Dict[str, str]: Normalized base name to credential ID.
+    """
+    index = {}
+    for cred_key, cred_id in credential_mapping.items():
+        base = cred_key.split(' ', 1)[0].lower()
+        index.setdefault(base, cred_id)
+        index.setdefault(base.replace('_', ' '), cred_id)
+    return index
+
+@lru_cache(maxsize=8)
+def _replacement_pattern(keys: Tuple[str, ...]) -> "re.Pattern":
+    """Compile one alternation pattern matching all replacement keys.
+
+    Longer keys are tried first so overlapping values match greedily.
+    Cached so the pattern is built once per replacement set, not once per
+    workflow.
+
+    Args:
+        keys (Tuple[str, ...]): The strings to be replaced.
+
+    Returns:
+        re.Pattern: Compiled pattern matching any of the keys.
+    """
+    return re.compile('|'.join(
+        re.escape(key) for key in sorted(keys, key=len, reverse=True)
+    ))
+
+@lru_cache(maxsize=8)
+def _postfix_pattern(postfixes: Tuple[str, ...]) -> "re.Pattern":
+    """Compile one pattern matching any trailing environment postfix.
+
+    Replaces a per-credential loop over all postfixes with a single regex
+    match. Cached so the pattern is built once per postfix set.
+
+    Args:
+        postfixes (Tuple[str, ...]): The environment postfixes.
+
+    Returns:
+        re.Pattern: Compiled pattern matching " <postfix>" at end of string.
+    """
+    return re.compile(' (' + '|'.join(
+        re.escape(postfix) for postfix in sorted(postfixes, key=len, reverse=True)
+    ) + ')$')
+
 def create_workflow(api_key: str, base_url: str, workflow_data: Dict, project_id: str, 
-                   credential_mapping: Dict, sf_id_mapping: Dict = None, env_type: str = 'dev', 
-                   supports_projects: bool = True, env_postfix: str = "") -> Optional[str]:
+                   credential_mapping: Dict, sf_id_mapping: Dict = None, env_type: str = 'dev',
+                   supports_projects: bool = True, env_postfix: str = "",
+                   replacements: Optional[Dict[str, str]] = None,
+                   cred_index: Optional[Dict[str, str]] = None,
+                   workflow_index: Optional[Dict] = None,
+                   mapping_store: Optional["ResourceMappingStore"] = None) -> Optional[str]:
     """Create a new workflow in n8n instance.
 
     Args:
@@ -222,6 +608,14 @@ def create_workflow(api_key: str, base_url: str, workflow_data: Dict, project_id
         env_type (str, optional): Type of environment. Defaults to 'dev'.
         supports_projects (bool, optional): Whether the instance supports projects. Defaults to True.
         env_postfix (str): Environment postfix to append to credential names.
+        replacements (Optional[Dict[str, str]]): Precomputed string replacements
+            for the target environment. Derived from credentials.yaml when omitted.
+        cred_index (Optional[Dict[str, str]]): Precomputed normalized credential
+            name index. Built from credential_mapping when omitted.
+        workflow_index (Optional[Dict]): Precomputed index_workflow result for
+            this workflow. Computed on the fly when omitted.
+        mapping_store (Optional[ResourceMappingStore]): Buffer for the resource
+            mapping entry. Written straight to disk when omitted.
 
     Returns:
         Optional[str]: The ID of the created workflow if successful, None otherwise.
@@ -231,81 +625,76 @@ def create_workflow(api_key: str, base_url: str, workflow_data: Dict, project_id
         "Content-Type": "application/json"
     }
     
-    workflow_payload = json.loads(json.dumps(workflow_data))
-    
+    workflow_payload = _json_deepcopy(workflow_data)
+
     try:
-        with open('credentials.yaml', 'r') as f:
-            creds_config = yaml.safe_load(f)
-        replacements = get_environment_replacements(creds_config, env_type)
-        
-        workflow_str = json.dumps(workflow_payload)
-        
-        for old_value, new_value in replacements.items():
-            workflow_str = workflow_str.replace(old_value, new_value)
-        
-        workflow_payload = json.loads(workflow_str)
-        
+        if replacements is None:
+            replacements = get_environment_replacements(load_credentials_config(), env_type)
+
+        # Skip the serialize/replace/parse round-trip entirely when there is
+        # nothing to replace; the deep copy above is already independent
+        if replacements:
+            workflow_str = _json_dumps_str(workflow_payload)
+            # One linear scan over the document instead of a full string
+            # copy per replacement
+            pattern = _replacement_pattern(tuple(replacements))
+            workflow_str = pattern.sub(lambda m: replacements[m.group(0)], workflow_str)
+            workflow_payload = _json_loads(workflow_str)
+
     except Exception as e:
         print_error(f"Warning: Could not apply string replacements: {str(e)}")
         workflow_payload = workflow_data
 
-    workflow_payload.update({
-        "settings": {
-            "saveExecutionProgress": workflow_payload.get('settings', {}).get('saveExecutionProgress', True),
-            "saveManualExecutions": workflow_payload.get('settings', {}).get('saveManualExecutions', True),
-            "saveDataErrorExecution": workflow_payload.get('settings', {}).get('saveDataErrorExecution', 'all'),
-            "executionTimeout": workflow_payload.get('settings', {}).get('executionTimeout', 3600),
-            "errorWorkflow": workflow_payload.get('settings', {}).get('errorWorkflow', '')
-        }
-    })
+    # Fill in default settings without rebuilding the dict: one lookup per
+    # key, and any extra settings from the backup survive the merge
+    settings = workflow_payload.setdefault('settings', {})
+    settings.setdefault('saveExecutionProgress', True)
+    settings.setdefault('saveManualExecutions', True)
+    settings.setdefault('saveDataErrorExecution', 'all')
+    settings.setdefault('executionTimeout', 3600)
+    settings.setdefault('errorWorkflow', '')
     
-    if 'nodes' in workflow_payload:
-        for node in workflow_payload['nodes']:
-            if 'credentials' in node:
-                for cred_type, cred_data in node['credentials'].items():
-                    old_name = cred_data.get('name', '')
-                    # Remove any existing postfix and whitespace
-                    base_name = old_name.split(' ')[0] if ' ' in old_name else old_name
-                    
-                    matching_cred = None
-                    for cred_key, new_id in credential_mapping.items():
-                        cred_base_name = cred_key.split(' ')[0] if ' ' in cred_key else cred_key
-                        if (cred_base_name.lower() == base_name.lower() or 
-                            cred_base_name.replace('_', ' ').lower() == base_name.lower()):
-                            matching_cred = new_id
-                            break
-                    
-                    if matching_cred:
-                        cred_data['id'] = matching_cred
-                    else:
-                        print_error(f"No matching credential found for: {old_name}")
-            
-            if node.get('type') == 'n8n-nodes-base.executeWorkflow' and sf_id_mapping:
-                params = node.get('parameters', {})
-                old_workflow_id = params.get('workflowId')
-                
-                if isinstance(old_workflow_id, str) and old_workflow_id in sf_id_mapping:
+    if cred_index is None:
+        cred_index = build_credential_index(credential_mapping)
+    if workflow_index is None:
+        workflow_index = index_workflow(workflow_data)
+
+    # The index carries node positions, so only nodes that actually need
+    # rewriting are visited instead of type-checking every node again
+    nodes = workflow_payload.get('nodes', [])
+
+    for position in workflow_index['cred_nodes']:
+        node = nodes[position]
+        for cred_type, cred_data in node['credentials'].items():
+            old_name = cred_data.get('name', '')
+            # Remove any existing postfix and whitespace
+            base_name = old_name.split(' ')[0] if ' ' in old_name else old_name
+
+            matching_cred = cred_index.get(base_name.lower())
+
+            if matching_cred:
+                cred_data['id'] = matching_cred
+            else:
+                print_error(f"No matching credential found for: {old_name}")
+
+    if sf_id_mapping:
+        for position, kind in workflow_index['subflow_nodes']:
+            node = nodes[position]
+            params = node.get('parameters', {})
+            old_workflow_id = params.get('workflowId')
+
+            if kind == 'execute' and isinstance(old_workflow_id, str):
+                if old_workflow_id in sf_id_mapping:
                     params['workflowId'] = sf_id_mapping[old_workflow_id]
                     print_success(f"Updated subworkflow reference in node '{node.get('name')}': {old_workflow_id} → {sf_id_mapping[old_workflow_id]}")
-                elif isinstance(old_workflow_id, dict):
-                    old_id = old_workflow_id.get('value')
-                    if old_id and old_id in sf_id_mapping:
-                        old_workflow_id['value'] = sf_id_mapping[old_id]
-                        print_success(f"Updated subworkflow reference in node '{node.get('name')}': {old_id} → {sf_id_mapping[old_id]}")
-                        if 'cachedResultName' in old_workflow_id:
-                            old_workflow_id['cachedResultName'] = old_workflow_id['cachedResultName'].split(' ')[0]
-            
-            elif node.get('type') == '@n8n/n8n-nodes-langchain.toolWorkflow' and sf_id_mapping:
-                params = node.get('parameters', {})
-                old_workflow_id = params.get('workflowId')
-                
-                if isinstance(old_workflow_id, dict):
-                    old_id = old_workflow_id.get('value')
-                    if old_id and old_id in sf_id_mapping:
-                        old_workflow_id['value'] = sf_id_mapping[old_id]
-                        print_success(f"Updated subworkflow reference in tool node '{node.get('name')}': {old_id} → {sf_id_mapping[old_id]}")
-                        if 'cachedResultName' in old_workflow_id:
-                            old_workflow_id['cachedResultName'] = old_workflow_id['cachedResultName'].split(' ')[0]
+            elif isinstance(old_workflow_id, dict):
+                old_id = old_workflow_id.get('value')
+                if old_id and old_id in sf_id_mapping:
+                    old_workflow_id['value'] = sf_id_mapping[old_id]
+                    label = 'tool node' if kind == 'tool' else 'node'
+                    print_success(f"Updated subworkflow reference in {label} '{node.get('name')}': {old_id} → {sf_id_mapping[old_id]}")
+                    if 'cachedResultName' in old_workflow_id:
+                        old_workflow_id['cachedResultName'] = old_workflow_id['cachedResultName'].split(' ')[0]
     
     create_payload = {
         "name": workflow_payload['name'],
@@ -315,10 +704,13 @@ def create_workflow(api_key: str, base_url: str, workflow_data: Dict, project_id
     }
     
     try:
-        response = requests.post(
+        # Pre-encode the body: workflow payloads can be dozens of KB and
+        # orjson serializes them far faster than requests' stdlib fallback
+        response = SESSION.post(
             f"{base_url}/api/v1/workflows",
             headers=headers,
-            json=create_payload
+            data=_json_dumps_bytes(create_payload),
+            timeout=TIMEOUT
         )
         
         if response.status_code != 200:
@@ -330,10 +722,11 @@ def create_workflow(api_key: str, base_url: str, workflow_data: Dict, project_id
         workflow_id = response.json().get('id')
         
         if supports_projects:
-            transfer_response = requests.put(
+            transfer_response = SESSION.put(
                 f"{base_url}/api/v1/workflows/{workflow_id}/transfer",
                 headers=headers,
-                json={"destinationProjectId": project_id}
+                data=_json_dumps_bytes({"destinationProjectId": project_id}),
+                timeout=TIMEOUT
             )
             
             if transfer_response.status_code not in [200, 204]:
@@ -341,13 +734,16 @@ def create_workflow(api_key: str, base_url: str, workflow_data: Dict, project_id
                 print_error(f"Failed to transfer workflow {workflow_payload['name']}: Status {transfer_response.status_code}")
                 print_error(f"Error details: {error_detail}")
                 try:
-                    requests.delete(f"{base_url}/api/v1/workflows/{workflow_id}", headers=headers)
+                    SESSION.delete(f"{base_url}/api/v1/workflows/{workflow_id}", headers=headers, timeout=TIMEOUT)
                     print_error("Cleaned up partially created workflow")
                 except Exception as cleanup_error:
                     print_error(f"Error during cleanup: {str(cleanup_error)}")
                 return None
         
-        save_resource_mapping(base_url, 'workflows', workflow_id, workflow_payload['name'])
+        if mapping_store is not None:
+            mapping_store.add(base_url, 'workflows', workflow_id, workflow_payload['name'])
+        else:
+            save_resource_mapping(base_url, 'workflows', workflow_id, workflow_payload['name'])
         print_success(f"Created workflow: {workflow_payload['name']}")
         return workflow_id
         
@@ -364,8 +760,8 @@ def save_mapping_info(filename: str, mapping_data: Dict) -> None:
         mapping_data (Dict): Dictionary containing mapping information.
     """
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(mapping_data, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(_json_dumps_pretty(mapping_data))
         print_success(f"Saved mapping information to {filename}")
     except Exception as e:
         print_error(f"Failed to save mapping information: {str(e)}")
@@ -378,19 +774,22 @@ def ensure_directory_exists(path: str) -> None:
     """
     Path(path).mkdir(parents=True, exist_ok=True)
 
-def save_workflow(workflow: Dict, base_path: str, subfolder: str) -> None:
+def save_workflow(workflow: Dict, base_path: str, subfolder: str, dir_ready: bool = False) -> None:
     """Save a workflow to the specified path and subfolder.
 
     Args:
         workflow (Dict): Dictionary containing workflow information.
         base_path (str): Base path to save the workflow.
         subfolder (str): Subfolder within the base path to save the workflow.
+        dir_ready (bool): When True, the caller guarantees the directory
+            already exists and the per-file mkdir/stat is skipped.
     """
     filepath = Path(base_path) / subfolder / f"{workflow['name']}_{workflow['id']}.json"
     try:
-        ensure_directory_exists(filepath.parent)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(workflow, f, indent=2, ensure_ascii=False)
+        if not dir_ready:
+            ensure_directory_exists(filepath.parent)
+        with open(filepath, 'wb') as f:
+            f.write(_json_dumps_pretty(workflow))
     except Exception as e:
         print_error(f"Failed to save workflow {workflow['name']}: {str(e)}")
 
@@ -404,14 +803,12 @@ def select_project(projects: List[Dict]) -> Optional[Dict]:
         Optional[Dict]: Selected project dictionary if successful, None otherwise.
     """
     while True:
-        try:
-            choice = int(input("\nSelect a project (number): ")) - 1
-            if 0 <= choice < len(projects):
-                return projects[choice]
-            print_error("Invalid choice. Please try again.")
-        except ValueError:
-            print_error("Please enter a number.")
-    return None
+        # Validate with isdigit instead of catching ValueError: typos are
+        # the common case here and exceptions are expensive for control flow
+        raw = input("\nSelect a project (number): ").strip()
+        if raw.isdigit() and 1 <= int(raw) <= len(projects):
+            return projects[int(raw) - 1]
+        print_error("Invalid choice. Please enter a number from the list.")
 
 def perform_backup(api_key: str, base_url: str, project: Dict, supports_projects: bool, server_name: str) -> None:
     """Backup all workflows from an n8n instance.
@@ -436,12 +833,22 @@ def perform_backup(api_key: str, base_url: str, project: Dict, supports_projects
     sanitized_server_name = "".join(c for c in server_name if c.isalnum() or c in (' ', '-', '_')).strip().replace(' ', '_')
     backup_path = Path("data") / f"backup_{sanitized_server_name}_{project['name']}_{timestamp}"
     print(f"\nCreating backup directory: {backup_path}")
-    ensure_directory_exists(backup_path)
-    
+    ensure_directory_exists(backup_path / "workflows")
+
     print("\nSaving workflows...")
-    for i, workflow in enumerate(workflows, 1):
-        save_workflow(workflow, backup_path, "workflows")
-        print(f"Progress: {i}/{len(workflows)} workflows saved", end='\r')
+    # JSON encoding is CPU-bound and the writes release the GIL, so
+    # overlapping them across workers hides most of the encode latency
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = [
+            pool.submit(save_workflow, workflow, backup_path, "workflows", True)
+            for workflow in workflows
+        ]
+        for i, future in enumerate(as_completed(futures), 1):
+            future.result()
+            # Updating the progress line on every file floods the TTY;
+            # every 10th completion is indistinguishable to the eye
+            if i % 10 == 0 or i == len(workflows):
+                print(f"Progress: {i}/{len(workflows)} workflows saved", end='\r')
     
     print("\n")
     print_success(f"Backup complete! {len(workflows)} workflows saved to {backup_path}")
@@ -455,33 +862,48 @@ def analyze_workflow_dependencies(workflow: Dict) -> List[str]:
     Returns:
         List[str]: List of workflow IDs that this workflow depends on.
     """
-    dependencies = []
-    
-    if 'nodes' not in workflow:
-        return dependencies
-        
-    for node in workflow['nodes']:
-        # Check for executeWorkflow nodes
-        if node.get('type') == 'n8n-nodes-base.executeWorkflow':
-            params = node.get('parameters', {})
-            workflow_id = params.get('workflowId')
+    return index_workflow(workflow)['deps']
+
+def index_workflow(workflow: Dict) -> Dict:
+    """Collect everything the restore path needs in one pass over the nodes.
+
+    Records dependency IDs plus the positions of nodes that need rewriting,
+    so create_workflow can jump straight to them instead of re-inspecting
+    every node's type. Positions are used rather than node references
+    because the creation payload is a copy of this workflow.
+
+    Args:
+        workflow (Dict): Dictionary containing workflow information.
+
+    Returns:
+        Dict: 'deps' (referenced workflow IDs), 'cred_nodes' (positions of
+        nodes with credentials), and 'subflow_nodes' (positions and kinds
+        of subworkflow-referencing nodes).
+    """
+    deps = []
+    cred_nodes = []
+    subflow_nodes = []
+
+    for position, node in enumerate(workflow.get('nodes', [])):
+        if 'credentials' in node:
+            cred_nodes.append(position)
+
+        node_type = node.get('type')
+        if node_type == 'n8n-nodes-base.executeWorkflow':
+            subflow_nodes.append((position, 'execute'))
+            workflow_id = node.get('parameters', {}).get('workflowId')
             if isinstance(workflow_id, str):
-                dependencies.append(workflow_id)
-            elif isinstance(workflow_id, dict):
-                old_id = workflow_id.get('value')
-                if old_id:
-                    dependencies.append(old_id)
-                    
-        # Check for toolWorkflow nodes
-        elif node.get('type') == '@n8n/n8n-nodes-langchain.toolWorkflow':
-            params = node.get('parameters', {})
-            workflow_id = params.get('workflowId')
-            if isinstance(workflow_id, dict):
-                old_id = workflow_id.get('value')
-                if old_id:
-                    dependencies.append(old_id)
-    
-    return dependencies
+                deps.append(workflow_id)
+            elif isinstance(workflow_id, dict) and workflow_id.get('value'):
+                deps.append(workflow_id['value'])
+
+        elif node_type == '@n8n/n8n-nodes-langchain.toolWorkflow':
+            subflow_nodes.append((position, 'tool'))
+            workflow_id = node.get('parameters', {}).get('workflowId')
+            if isinstance(workflow_id, dict) and workflow_id.get('value'):
+                deps.append(workflow_id['value'])
+
+    return {'deps': deps, 'cred_nodes': cred_nodes, 'subflow_nodes': subflow_nodes}
 
 def build_dependency_graph(workflows: List[Dict]) -> Dict[str, List[str]]:
     """Build a graph of workflow dependencies.
@@ -496,8 +918,35 @@ def build_dependency_graph(workflows: List[Dict]) -> Dict[str, List[str]]:
     for workflow in workflows:
         workflow_id = workflow['id']
         graph[workflow_id] = analyze_workflow_dependencies(workflow)
+
+    # Drop references to workflows outside this set: they cannot be
+    # created here and would otherwise count against every readiness check
+    for workflow_id, deps in graph.items():
+        graph[workflow_id] = [dep for dep in deps if dep in graph]
+
     return graph
 
+def _indegree_and_dependents(graph: Dict[str, List[str]]) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+    """Build the indegree map and reverse adjacency for a dependency graph.
+
+    Args:
+        graph (Dict[str, List[str]]): Dictionary mapping workflow IDs to their dependencies.
+
+    Returns:
+        Tuple[Dict[str, int], Dict[str, List[str]]]: Per-workflow dependency
+        counts and the workflows depending on each workflow.
+    """
+    indegree = {workflow_id: 0 for workflow_id in graph}
+    dependents = defaultdict(list)
+
+    for workflow_id, deps in graph.items():
+        for dep in deps:
+            if dep in indegree:
+                indegree[workflow_id] += 1
+                dependents[dep].append(workflow_id)
+
+    return indegree, dependents
+
 def get_workflow_order(graph: Dict[str, List[str]]) -> List[str]:
     """Determine the order in which workflows should be created based on dependencies.
 
@@ -507,27 +956,60 @@ def get_workflow_order(graph: Dict[str, List[str]]) -> List[str]:
     Returns:
         List[str]: List of workflow IDs in the order they should be created.
     """
-    # Create a copy of the graph to modify
-    remaining = graph.copy()
+    # Kahn's algorithm: O(V+E) instead of rescanning all remaining
+    # workflows on every step
+    indegree, dependents = _indegree_and_dependents(graph)
+    ready = deque(workflow_id for workflow_id, count in indegree.items() if count == 0)
     order = []
-    
-    while remaining:
-        # Find workflows with no remaining dependencies
-        ready = [workflow_id for workflow_id, deps in remaining.items() 
-                if not any(dep in remaining for dep in deps)]
-        
-        if not ready:
-            # If no ready workflows but still have remaining, we have a cycle
-            raise ValueError("Circular dependency detected in workflows")
-            
-        # Add ready workflows to order and remove them from remaining
-        order.extend(ready)
-        for workflow_id in ready:
-            del remaining[workflow_id]
-    
+
+    while ready:
+        workflow_id = ready.popleft()
+        order.append(workflow_id)
+        for dependent in dependents[workflow_id]:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                ready.append(dependent)
+
+    if len(order) != len(graph):
+        raise ValueError("Circular dependency detected in workflows")
+
     return order
 
-def perform_restore(api_key: str, base_url: str, project: Dict, supports_projects: bool, target_env: str) -> None:
+def get_workflow_waves(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """Group workflows into dependency waves.
+
+    Workflows in one wave only depend on workflows from earlier waves, so
+    each wave can be created concurrently once the previous one finished.
+
+    Args:
+        graph (Dict[str, List[str]]): Dictionary mapping workflow IDs to their dependencies.
+
+    Returns:
+        List[List[str]]: Waves of workflow IDs in creation order.
+    """
+    indegree, dependents = _indegree_and_dependents(graph)
+    wave = [workflow_id for workflow_id, count in indegree.items() if count == 0]
+    waves = []
+    ordered = 0
+
+    while wave:
+        waves.append(wave)
+        ordered += len(wave)
+        next_wave = []
+        for workflow_id in wave:
+            for dependent in dependents[workflow_id]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    next_wave.append(dependent)
+        wave = next_wave
+
+    if ordered != len(graph):
+        raise ValueError("Circular dependency detected in workflows")
+
+    return waves
+
+def perform_restore(api_key: str, base_url: str, project: Dict, supports_projects: bool, target_env: str,
+                    backup_name: Optional[str] = None) -> None:
     """Restore workflows to an n8n instance.
 
     Args:
@@ -536,6 +1018,8 @@ def perform_restore(api_key: str, base_url: str, project: Dict, supports_project
         project (Dict): Dictionary containing project information.
         supports_projects (bool): Whether the instance supports projects.
         target_env (str): Target environment to restore to ('production' or 'development').
+        backup_name (Optional[str]): Backup directory name to restore, or
+            'latest' for the most recent one. Prompts interactively when omitted.
     """
     stats = {
         'workflows_created': 0,
@@ -546,13 +1030,17 @@ def perform_restore(api_key: str, base_url: str, project: Dict, supports_project
 
     print("\nLoading credentials configuration...")
     try:
-        with open('credentials.yaml', 'r') as f:
-            creds_config = yaml.safe_load(f)
+        creds_config = load_credentials_config()
         print_success("Credentials configuration loaded")
     except Exception as e:
         print_error(f"Error loading credentials.yaml: {str(e)}")
         return
 
+    # Compute these once for the whole restore; every create_credential/
+    # create_workflow call below reuses them instead of re-parsing the YAML
+    all_postfixes = get_all_postfixes(creds_config)
+    replacements = get_environment_replacements(creds_config, target_env)
+
     print_summary("Restore Process")
     print(f"Target Server: {base_url}")
     print(f"Project: {project['name']}")
@@ -569,19 +1057,28 @@ def perform_restore(api_key: str, base_url: str, project: Dict, supports_project
         print_error("No backups found in data directory.")
         return
 
-    print("\nAvailable backups:")
-    for i, backup in enumerate(backups, 1):
-        print(f"{i}. {backup.name}")
-
-    while True:
-        try:
-            choice = int(input("\nSelect backup to restore (number): ")) - 1
-            if 0 <= choice < len(backups):
-                backup_dir = backups[choice]
+    if backup_name:
+        # Non-interactive selection: backup directory names embed the
+        # timestamp, so the lexicographic maximum is the most recent
+        if backup_name == 'latest':
+            backup_dir = max(backups, key=lambda d: d.name)
+        else:
+            backup_dir = next((d for d in backups if d.name == backup_name), None)
+            if backup_dir is None:
+                print_error(f"Backup {backup_name} not found in data directory.")
+                return
+        print_success(f"Using backup: {backup_dir.name}")
+    else:
+        print("\nAvailable backups:")
+        for i, backup in enumerate(backups, 1):
+            print(f"{i}. {backup.name}")
+
+        while True:
+            raw = input("\nSelect backup to restore (number): ").strip()
+            if raw.isdigit() and 1 <= int(raw) <= len(backups):
+                backup_dir = backups[int(raw) - 1]
                 break
-            print_error("Invalid choice. Please try again.")
-        except ValueError:
-            print_error("Please enter a number.")
+            print_error("Invalid choice. Please enter a number from the list.")
 
     workflow_dir = backup_dir / "workflows"
     if not workflow_dir.exists():
@@ -590,13 +1087,16 @@ def perform_restore(api_key: str, base_url: str, project: Dict, supports_project
 
     print("\nLoading workflows from backup...")
     workflows = []
-    for workflow_file in workflow_dir.glob("*.json"):
-        try:
-            with open(workflow_file, 'r', encoding='utf-8') as f:
-                workflow = json.load(f)
-                workflows.append(workflow)
-        except Exception as e:
-            print_error(f"Error loading workflow {workflow_file.name}: {str(e)}")
+    # scandir returns entries without the extra stat that glob pays per file
+    with os.scandir(workflow_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.json'):
+                continue
+            try:
+                with open(entry.path, 'rb') as f:
+                    workflows.append(_json_loads(f.read()))
+            except Exception as e:
+                print_error(f"Error loading workflow {entry.name}: {str(e)}")
 
     if not workflows:
         print_error("No workflows found in backup")
@@ -606,73 +1106,113 @@ def perform_restore(api_key: str, base_url: str, project: Dict, supports_project
 
     print("\nCreating credentials...")
     credential_mapping = {}
-    
-    if creds_config and 'environments' in creds_config and target_env in creds_config['environments']:
-        env_data = creds_config['environments'][target_env]
-        env_credentials = env_data.get('credentials', {})
-        env_name = env_data.get('name', target_env.title())
-        env_postfix = env_data.get('postfix', '').strip()
-        
-        print_success(f"Using environment: {env_name}")
-        if env_postfix:
-            print_success(f"Environment postfix: {env_postfix}")
-        
-        for cred_key, cred_data in env_credentials.items():
-            try:
-                credential_data = {
-                    "name": cred_data['name'],
-                    "data": cred_data['data']
-                }
-                
-                new_cred_id = create_credential(api_key, base_url, credential_data, cred_data['type'], env_postfix)
-                
-                if new_cred_id:
-                    credential_mapping[cred_key] = new_cred_id
-                    credential_mapping[cred_data['name']] = new_cred_id
-                    stats['credentials_created'] += 1
-                    print_success(f"Created credential: {cred_data['name']}{' ' + env_postfix if env_postfix else ''}")
-                else:
-                    stats['credentials_failed'] += 1
-                    print_error(f"Failed to create credential: {cred_data['name']}{' ' + env_postfix if env_postfix else ''}")
-                    
-            except Exception as e:
-                stats['credentials_failed'] += 1
-                print_error(f"Error processing credential {cred_data['name']}: {str(e)}")
-    else:
-        print_error(f"No credentials found for environment: {target_env}")
-        return
 
-    print("\nAnalyzing workflow dependencies...")
+    # Buffer resource mapping entries in memory; one flush at the end of
+    # the restore replaces a full file rewrite per created resource
+    mapping_store = ResourceMappingStore()
+
     try:
-        dependency_graph = build_dependency_graph(workflows)
-        workflow_order = get_workflow_order(dependency_graph)
-        print_success(f"Found {len(workflow_order)} workflows to create in correct order")
-    except ValueError as e:
-        print_error(f"Error analyzing dependencies: {str(e)}")
-        return
+        if creds_config and 'environments' in creds_config and target_env in creds_config['environments']:
+            env_data = creds_config['environments'][target_env]
+            env_credentials = env_data.get('credentials', {})
+            env_name = env_data.get('name', target_env.title())
+            env_postfix = env_data.get('postfix', '').strip()
+
+            print_success(f"Using environment: {env_name}")
+            if env_postfix:
+                print_success(f"Environment postfix: {env_postfix}")
+
+            # Credentials have no interdependencies, so create them all at once
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+                futures = {
+                    pool.submit(
+                        create_credential, api_key, base_url,
+                        {"name": cred_data['name'], "data": cred_data['data']},
+                        cred_data['type'], env_postfix, all_postfixes,
+                        mapping_store
+                    ): (cred_key, cred_data)
+                    for cred_key, cred_data in env_credentials.items()
+                }
 
-    print("\nCreating workflows in dependency order...")
-    workflow_mapping = {}
-    for workflow_id in workflow_order:
-        # Find the workflow data
-        workflow_data = next(w for w in workflows if w['id'] == workflow_id)
-        
-        # Create the workflow
-        new_id = create_workflow(api_key, base_url, workflow_data, project.get('id'), 
-                               credential_mapping, workflow_mapping, target_env, supports_projects,
-                               env_postfix)
-        
-        if new_id:
-            stats['workflows_created'] += 1
-            workflow_mapping[workflow_id] = new_id
-            print_success(f"Created workflow: {workflow_data['name']}")
+                for future in as_completed(futures):
+                    cred_key, cred_data = futures[future]
+                    try:
+                        new_cred_id = future.result()
+
+                        if new_cred_id:
+                            credential_mapping[cred_key] = new_cred_id
+                            credential_mapping[cred_data['name']] = new_cred_id
+                            stats['credentials_created'] += 1
+                            print_success(f"Created credential: {cred_data['name']}{' ' + env_postfix if env_postfix else ''}")
+                        else:
+                            stats['credentials_failed'] += 1
+                            print_error(f"Failed to create credential: {cred_data['name']}{' ' + env_postfix if env_postfix else ''}")
+
+                    except Exception as e:
+                        stats['credentials_failed'] += 1
+                        print_error(f"Error processing credential {cred_data['name']}: {str(e)}")
         else:
-            stats['workflows_failed'] += 1
-            print_error(f"Failed to create workflow: {workflow_data['name']}")
+            print_error(f"No credentials found for environment: {target_env}")
+            return
+
+        print("\nAnalyzing workflow dependencies...")
+        try:
+            # One indexing pass per workflow feeds both the dependency graph
+            # here and the node rewrites inside create_workflow
+            workflow_indexes = {w['id']: index_workflow(w) for w in workflows}
+            dependency_graph = {
+                workflow_id: [dep for dep in index['deps'] if dep in workflow_indexes]
+                for workflow_id, index in workflow_indexes.items()
+            }
+            workflow_waves = get_workflow_waves(dependency_graph)
+            print_success(f"Found {sum(len(w) for w in workflow_waves)} workflows to create in {len(workflow_waves)} waves")
+        except ValueError as e:
+            print_error(f"Error analyzing dependencies: {str(e)}")
+            return
 
-    print_summary("Restore Complete")
-    print(f"Credentials: {stats['credentials_created']} created, {stats['credentials_failed']} failed")
-    print(f"Workflows: {stats['workflows_created']} created, {stats['workflows_failed']} failed")
+        print("\nCreating workflows in dependency order...")
+        cred_index = build_credential_index(credential_mapping)
+        workflows_by_id = {w['id']: w for w in workflows}
+        workflow_mapping = {}
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            # Each wave only depends on workflows from completed waves, so
+            # all workflows within a wave can be created concurrently
+            for wave in workflow_waves:
+                futures = {
+                    pool.submit(
+                        create_workflow, api_key, base_url, workflows_by_id[workflow_id],
+                        project.get('id'), credential_mapping, workflow_mapping,
+                        target_env, supports_projects, env_postfix, replacements,
+                        cred_index, workflow_indexes[workflow_id], mapping_store
+                    ): workflow_id
+                    for workflow_id in wave
+                }
+
+                for future in as_completed(futures):
+                    workflow_id = futures[future]
+                    workflow_data = workflows_by_id[workflow_id]
+                    try:
+                        new_id = future.result()
+                    except Exception as e:
+                        print_error(f"Error creating workflow {workflow_data['name']}: {str(e)}")
+                        new_id = None
+
+                    if new_id:
+                        stats['workflows_created'] += 1
+                        workflow_mapping[workflow_id] = new_id
+                        print_success(f"Created workflow: {workflow_data['name']}")
+                    else:
+                        stats['workflows_failed'] += 1
+                        print_error(f"Failed to create workflow: {workflow_data['name']}")
+
+        print_summary("Restore Complete")
+        print(f"Credentials: {stats['credentials_created']} created, {stats['credentials_failed']} failed")
+        print(f"Workflows: {stats['workflows_created']} created, {stats['workflows_failed']} failed")
+    finally:
+        mapping_store.flush()
+        # The instance listings changed; drop the cached GETs so a backup
+        # in the same session sees the just-created workflows
+        clear_get_cache()
 
 def load_server_config() -> Dict:
     """Load server configuration from servers.yaml file.
@@ -685,7 +1225,7 @@ def load_server_config() -> Dict:
     """
     try:
         with open('servers.yaml', 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YamlLoader)
     except FileNotFoundError:
         print_error("servers.yaml not found. Please copy servers.yaml.example to servers.yaml and configure your servers.")
         sys.exit(1)
@@ -708,13 +1248,10 @@ def print_menu(title: str, options: List[str]) -> int:
         print(f"{i}. {option}")
     
     while True:
-        try:
-            choice = int(input("\nSelect option (number): ")) - 1
-            if 0 <= choice < len(options):
-                return choice
-            print_error("Invalid choice. Please try again.")
-        except ValueError:
-            print_error("Please enter a number.")
+        raw = input("\nSelect option (number): ").strip()
+        if raw.isdigit() and 1 <= int(raw) <= len(options):
+            return int(raw) - 1
+        print_error("Invalid choice. Please enter a number from the list.")
 
 def select_server(servers: Dict) -> Tuple[str, Dict]:
     """Let user select a server from the list.
@@ -784,10 +1321,10 @@ def test_api_connection(api_key: str, base_url: str) -> bool:
     Returns:
         bool: True if the connection is successful, False otherwise.
     """
-    headers = {"X-N8N-API-KEY": api_key}
     try:
-        # Try to get workflows, which is a core API endpoint
-        response = requests.get(f"{base_url}/api/v1/workflows", headers=headers)
+        # Probe a core API endpoint, but only ask for one workflow: the
+        # probe only needs the status code, not a full listing payload
+        response = _api_client(base_url, api_key).probe()
         if response.status_code == 200:
             print_success("API connection successful")
             return True
@@ -795,6 +1332,9 @@ def test_api_connection(api_key: str, base_url: str) -> bool:
             print_error(f"API connection failed: {response.status_code}")
             print_error(f"Error details: {response.text}")
             return False
+    except requests.exceptions.Timeout:
+        print_error("Connection to n8n instance timed out.")
+        return False
     except requests.exceptions.ConnectionError:
         print_error("Failed to connect to n8n instance. Is it running?")
         return False
@@ -802,6 +1342,30 @@ def test_api_connection(api_key: str, base_url: str) -> bool:
         print_error(f"Error testing API connection: {str(e)}")
         return False
 
+def prefetch_instance_data(api_key: str, base_url: str) -> bool:
+    """Probe the instance and warm the list caches in one concurrent burst.
+
+    The menus after server selection each pay a round-trip for a listing
+    (projects for selection, workflows for backup). Firing those GETs
+    while the connectivity probe is in flight hides their latency behind
+    the probe; the later calls then hit the TTL cache.
+
+    Args:
+        api_key (str): The API key for authentication.
+        base_url (str): The base URL of the n8n instance.
+
+    Returns:
+        bool: True if the connectivity probe succeeded.
+    """
+    headers = {"X-N8N-API-KEY": api_key}
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        probe = pool.submit(test_api_connection, api_key, base_url)
+        # Warm-up fetches: results land in _GET_CACHE, failures are
+        # reported by the real calls later
+        pool.submit(_cached_get, f"{base_url}/api/v1/projects", headers)
+        pool.submit(_cached_get, f"{base_url}/api/v1/workflows", headers)
+        return probe.result()
+
 def main() -> None:
     """Main entry point for the n8n workflow migration tool."""
     while True:
@@ -811,8 +1375,9 @@ def main() -> None:
             return
 
         try:
-            with open('servers.yaml', 'r') as f:
-                servers = yaml.safe_load(f)
+            # Re-stat per menu iteration: the cached parse is reused with
+            # the C loader unless the file changed between round-trips
+            servers = _load_yaml_cached('servers.yaml', os.stat('servers.yaml').st_mtime_ns)
         except Exception as e:
             print_error(f"Error loading servers.yaml: {str(e)}")
             return
@@ -840,8 +1405,8 @@ def main() -> None:
         print_success(f"Selected server: {server_config['name']}")
         print_success(f"Projects supported: {'Yes' if supports_projects else 'No'}")
         
-        # Test API connection before proceeding
-        if not test_api_connection(api_key, base_url):
+        # Test API connection and prefetch listings before proceeding
+        if not prefetch_instance_data(api_key, base_url):
             print_error("Failed to connect to n8n instance. Please check your API key and make sure the instance is running.")
             continue
         
@@ -878,30 +1443,43 @@ def main() -> None:
         # Wait for user to press any key before continuing
         input("\nPress Enter to continue...")
 
-def perform_cleanup(api_key: str, base_url: str, project: Dict) -> None:
+@dataclass
+class CleanupStats:
+    """Counters for one cleanup run, aggregated after the deletes finish."""
+    workflows_deleted: int = 0
+    workflows_failed: int = 0
+    credentials_deleted: int = 0
+    credentials_failed: int = 0
+
+def perform_cleanup(api_key: str, base_url: str, project: Dict, confirm: bool = True) -> None:
     """Delete all workflows and credentials from an instance.
 
     Args:
         api_key (str): The API key for authentication.
         base_url (str): The base URL of the n8n instance.
         project (Dict): Dictionary containing project information.
+        confirm (bool): When False, skip the interactive confirmation
+            prompt (used by batch mode).
     """
     print("\nWarning: This will delete ONLY the workflows and credentials that were automatically created")
     print("and are tracked in resource_mapping.json. Any manually created resources will not be affected.")
-    confirm = input("Are you sure you want to proceed? (yes/no): ")
-    
-    if confirm.lower() != 'yes':
-        print("Operation cancelled.")
-        return
+    if confirm:
+        answer = input("Are you sure you want to proceed? (yes/no): ")
 
-    stats = {
-        'workflows_deleted': 0,
-        'workflows_failed': 0,
-        'credentials_deleted': 0,
-        'credentials_failed': 0
-    }
+        if answer.lower() != 'yes':
+            print("Operation cancelled.")
+            return
 
-    resources = get_instance_resources(base_url)
+    stats = CleanupStats()
+
+    # Load the mapping once, prune it in memory as deletes succeed, and
+    # write it back once at the end: 2 file syscalls instead of 2 per delete
+    mappings = _load_mappings()
+    resources = mappings.get(base_url, {
+        'workflows': {},
+        'credentials': {},
+        'projects': {}
+    })
 
     if not resources['workflows'] and not resources['credentials']:
         print("\nNo tracked resources found in resource_mapping.json for this instance.")
@@ -911,38 +1489,51 @@ def perform_cleanup(api_key: str, base_url: str, project: Dict) -> None:
         print("3. Resources were created manually and are not tracked")
         return
 
-    print("\nDeleting credentials...")
-    for cred_id, cred_name in resources['credentials'].items():
-        try:
-            delete_credential(api_key, base_url, cred_id)
-            stats['credentials_deleted'] += 1
-            print_success(f"Deleted credential: {cred_name}")
-        except Exception as e:
-            stats['credentials_failed'] += 1
-            print_error(f"Failed to delete credential {cred_name}: {str(e)}")
+    client = _api_client(base_url, api_key)
 
-    print("\nDeleting workflows...")
-    for workflow_id, workflow_name in resources['workflows'].items():
-        try:
-            delete_workflow(api_key, base_url, workflow_id)
-            stats['workflows_deleted'] += 1
-            print_success(f"Deleted workflow: {workflow_name}")
-        except Exception as e:
-            stats['workflows_failed'] += 1
-            print_error(f"Failed to delete workflow {workflow_name}: {str(e)}")
-
-    if project.get('id') and project['id'] in resources['projects']:
-        try:
-            delete_project(api_key, base_url, project['id'])
-            print_success(f"Deleted project: {project['name']}")
-        except Exception as e:
-            print_error(f"Failed to delete project {project['name']}: {str(e)}")
+    try:
+        # One bulk call per resource kind when the instance supports it,
+        # otherwise concurrent per-ID deletes
+        print("\nDeleting credentials...")
+        names = dict(resources['credentials'])
+        deleted, failures = client.bulk_delete(list(names), 'credentials')
+        stats.credentials_deleted = len(deleted)
+        stats.credentials_failed = len(failures)
+        for cred_id in deleted:
+            resources['credentials'].pop(cred_id, None)
+            print_success(f"Deleted credential: {names[cred_id]}")
+        for cred_id, reason in failures.items():
+            print_error(f"Failed to delete credential {names[cred_id]}: {reason}")
+
+        print("\nDeleting workflows...")
+        names = dict(resources['workflows'])
+        deleted, failures = client.bulk_delete(list(names), 'workflows')
+        stats.workflows_deleted = len(deleted)
+        stats.workflows_failed = len(failures)
+        for workflow_id in deleted:
+            resources['workflows'].pop(workflow_id, None)
+            print_success(f"Deleted workflow: {names[workflow_id]}")
+        for workflow_id, reason in failures.items():
+            print_error(f"Failed to delete workflow {names[workflow_id]}: {reason}")
+
+        if project.get('id') and project['id'] in resources.get('projects', {}):
+            try:
+                delete_project(api_key, base_url, project['id'], persist=False)
+                resources['projects'].pop(project['id'], None)
+                print_success(f"Deleted project: {project['name']}")
+            except Exception as e:
+                print_error(f"Failed to delete project {project['name']}: {str(e)}")
+    finally:
+        # One write preserves partial progress even if interrupted mid-run
+        _save_mappings(mappings)
+        # Cached workflow/project listings no longer match the instance
+        clear_get_cache()
 
     print("\nCleanup Summary:")
-    print(f"Credentials deleted: {stats['credentials_deleted']}")
-    print(f"Credentials failed to delete: {stats['credentials_failed']}")
-    print(f"Workflows deleted: {stats['workflows_deleted']}")
-    print(f"Workflows failed to delete: {stats['workflows_failed']}")
+    print(f"Credentials deleted: {stats.credentials_deleted}")
+    print(f"Credentials failed to delete: {stats.credentials_failed}")
+    print(f"Workflows deleted: {stats.workflows_deleted}")
+    print(f"Workflows failed to delete: {stats.workflows_failed}")
     print("\nNote: Only resources tracked in resource_mapping.json were affected.")
 
 def get_workflow_by_id(api_key: str, base_url: str, workflow_id: str) -> Optional[Dict]:
@@ -956,12 +1547,8 @@ def get_workflow_by_id(api_key: str, base_url: str, workflow_id: str) -> Optiona
     Returns:
         Optional[Dict]: Dictionary containing workflow information if successful, None otherwise.
     """
-    headers = {"X-N8N-API-KEY": api_key}
     try:
-        response = requests.get(
-            f"{base_url}/api/v1/workflows/{workflow_id}",
-            headers=headers
-        )
+        response = _api_client(base_url, api_key).get_workflow(workflow_id)
         if response.status_code == 200:
             return response.json()
         else:
@@ -971,6 +1558,89 @@ def get_workflow_by_id(api_key: str, base_url: str, workflow_id: str) -> Optiona
         print_error(f"Error getting workflow {workflow_id}: {str(e)}")
         return None
 
+def _load_mappings(storage_file: str = 'resource_mapping.json') -> Dict:
+    """Load the full resource mapping file.
+
+    Args:
+        storage_file (str): Path of the mapping file.
+
+    Returns:
+        Dict: All instance mappings, or an empty dict when missing/unreadable.
+    """
+    try:
+        return _read_mappings_cached(storage_file)
+    except Exception as e:
+        print_error(f"Failed to load resource mappings: {str(e)}")
+    return {}
+
+# Parsed mapping cache keyed on file mtime: repeated reads in one CLI
+# session skip the disk read and JSON parse entirely
+_MAPPING_CACHE: Dict = {"path": None, "mtime": -1, "data": None}
+
+def _read_mappings_cached(storage_file: str) -> Dict:
+    """Read a mapping file, reusing the parse when the file is unchanged.
+
+    Args:
+        storage_file (str): Path of the mapping file.
+
+    Returns:
+        Dict: A private copy of all instance mappings; empty when missing.
+    """
+    try:
+        st = os.stat(storage_file)
+    except OSError:
+        _MAPPING_CACHE.update(path=None, mtime=-1, data=None)
+        return {}
+
+    if (_MAPPING_CACHE["path"] == storage_file
+            and _MAPPING_CACHE["mtime"] == st.st_mtime_ns
+            and _MAPPING_CACHE["data"] is not None):
+        return _json_deepcopy(_MAPPING_CACHE["data"])
+
+    with open(storage_file, 'rb') as f:
+        data = _json_loads(f.read())
+    _MAPPING_CACHE.update(path=storage_file, mtime=st.st_mtime_ns, data=data)
+    return _json_deepcopy(data)
+
+def _write_mappings_atomic(mappings: Dict, storage_file: str) -> None:
+    """Write a mapping file atomically via a sibling tempfile and rename.
+
+    A crash mid-write can never truncate the existing file. The write is
+    not fsynced by default; set MAPPING_DURABLE=1 to trade the fsync stall
+    for durability across power loss.
+
+    Args:
+        mappings (Dict): All instance mappings.
+        storage_file (str): Path of the mapping file.
+    """
+    tmp_file = f"{storage_file}.tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(_json_dumps_pretty(mappings))
+        if os.environ.get('MAPPING_DURABLE') == '1':
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_file, storage_file)
+    # Seed the read cache so the next load is a memory copy, not a file read
+    try:
+        _MAPPING_CACHE.update(path=storage_file,
+                              mtime=os.stat(storage_file).st_mtime_ns,
+                              data=_json_deepcopy(mappings))
+    except OSError:
+        _MAPPING_CACHE.update(path=None, mtime=-1, data=None)
+
+def _save_mappings(mappings: Dict, storage_file: str = 'resource_mapping.json') -> None:
+    """Write the full resource mapping file in one pass.
+
+    Args:
+        mappings (Dict): All instance mappings.
+        storage_file (str): Path of the mapping file.
+    """
+    try:
+        with _RESOURCE_MAPPING_LOCK:
+            _write_mappings_atomic(mappings, storage_file)
+    except Exception as e:
+        print_error(f"Failed to save resource mappings: {str(e)}")
+
 def remove_resource_mapping(instance_url: str, resource_type: str, resource_id: str) -> None:
     """Remove resource mapping from local storage.
 
@@ -981,74 +1651,69 @@ def remove_resource_mapping(instance_url: str, resource_type: str, resource_id:
     """
     storage_file = 'resource_mapping.json'
     try:
-        if os.path.exists(storage_file):
-            with open(storage_file, 'r') as f:
-                mappings = json.load(f)
-            
-            if (instance_url in mappings and 
-                resource_type in mappings[instance_url] and 
+        with _RESOURCE_MAPPING_LOCK:
+            mappings = _read_mappings_cached(storage_file)
+
+            if (instance_url in mappings and
+                resource_type in mappings[instance_url] and
                 resource_id in mappings[instance_url][resource_type]):
                 del mappings[instance_url][resource_type][resource_id]
-                
-                with open(storage_file, 'w') as f:
-                    json.dump(mappings, f, indent=2)
+
+                _write_mappings_atomic(mappings, storage_file)
 
     except Exception as e:
         print_error(f"Failed to remove resource mapping: {str(e)}")
 
-def delete_workflow(api_key: str, base_url: str, workflow_id: str) -> None:
+def delete_workflow(api_key: str, base_url: str, workflow_id: str, persist: bool = True) -> None:
     """Delete a workflow by ID.
 
     Args:
         api_key (str): The API key for authentication.
         base_url (str): The base URL of the n8n instance.
         workflow_id (str): ID of the workflow to delete.
+        persist (bool): When False, skip the per-call mapping file rewrite;
+            the caller is expected to update the mapping itself.
 
     Raises:
         Exception: If the workflow deletion fails.
     """
-    url = f"{base_url}/api/v1/workflows/{workflow_id}"
-    headers = {"X-N8N-API-KEY": api_key}
-    response = requests.delete(url, headers=headers)
-    if response.status_code != 200:
-        raise Exception(f"Failed to delete workflow: {response.text}")
-    remove_resource_mapping(base_url, 'workflows', workflow_id)
+    _api_client(base_url, api_key).delete_workflow(workflow_id)
+    if persist:
+        remove_resource_mapping(base_url, 'workflows', workflow_id)
 
-def delete_credential(api_key: str, base_url: str, credential_id: str) -> None:
+def delete_credential(api_key: str, base_url: str, credential_id: str, persist: bool = True) -> None:
     """Delete a credential by ID.
 
     Args:
         api_key (str): The API key for authentication.
         base_url (str): The base URL of the n8n instance.
         credential_id (str): ID of the credential to delete.
+        persist (bool): When False, skip the per-call mapping file rewrite;
+            the caller is expected to update the mapping itself.
 
     Raises:
         Exception: If the credential deletion fails.
     """
-    url = f"{base_url}/api/v1/credentials/{credential_id}"
-    headers = {"X-N8N-API-KEY": api_key}
-    response = requests.delete(url, headers=headers)
-    if response.status_code != 200:
-        raise Exception(f"Failed to delete credential: {response.text}")
-    remove_resource_mapping(base_url, 'credentials', credential_id)
+    _api_client(base_url, api_key).delete_credential(credential_id)
+    if persist:
+        remove_resource_mapping(base_url, 'credentials', credential_id)
 
-def delete_project(api_key: str, base_url: str, project_id: str) -> None:
+def delete_project(api_key: str, base_url: str, project_id: str, persist: bool = True) -> None:
     """Delete a project by ID.
 
     Args:
         api_key (str): The API key for authentication.
         base_url (str): The base URL of the n8n instance.
         project_id (str): ID of the project to delete.
+        persist (bool): When False, skip the per-call mapping file rewrite;
+            the caller is expected to update the mapping itself.
 
     Raises:
         Exception: If the project deletion fails.
     """
-    url = f"{base_url}/api/v1/projects/{project_id}"
-    headers = {"X-N8N-API-KEY": api_key}
-    response = requests.delete(url, headers=headers)
-    if response.status_code != 200:
-        raise Exception(f"Failed to delete project: {response.text}")
-    remove_resource_mapping(base_url, 'projects', project_id)
+    _api_client(base_url, api_key).delete_project(project_id)
+    if persist:
+        remove_resource_mapping(base_url, 'projects', project_id)
 
 def get_credentials(api_key: str, base_url: str) -> List[Dict]:
     """Get all credentials from the instance.
@@ -1063,14 +1728,7 @@ def get_credentials(api_key: str, base_url: str) -> List[Dict]:
     Raises:
         Exception: If the credentials retrieval fails.
     """
-    url = f"{base_url}/api/v1/credentials"
-    headers = {"X-N8N-API-KEY": api_key}
-    response = requests.get(url, headers=headers)
-    
-    if response.status_code != 200:
-        raise Exception(f"Failed to get credentials: {response.text}")
-    
-    return response.json()['data']
+    return _api_client(base_url, api_key).get_credentials()
 
 def save_resource_mapping(instance_url: str, resource_type: str, resource_id: str, resource_name: str) -> None:
     """Save resource mapping to local storage.
@@ -1083,26 +1741,79 @@ def save_resource_mapping(instance_url: str, resource_type: str, resource_id: st
     """
     storage_file = 'resource_mapping.json'
     try:
-        if os.path.exists(storage_file):
-            with open(storage_file, 'r') as f:
-                mappings = json.load(f)
-        else:
-            mappings = {}
+        with _RESOURCE_MAPPING_LOCK:
+            mappings = _read_mappings_cached(storage_file)
 
-        if instance_url not in mappings:
-            mappings[instance_url] = {
+            if instance_url not in mappings:
+                mappings[instance_url] = {
+                    'workflows': {},
+                    'credentials': {},
+                    'projects': {}
+                }
+
+            mappings[instance_url][resource_type][resource_id] = resource_name
+
+            _write_mappings_atomic(mappings, storage_file)
+
+    except Exception as e:
+        print_error(f"Failed to save resource mapping: {str(e)}")
+
+class ResourceMappingStore:
+    """In-memory buffer for resource mapping updates.
+
+    save_resource_mapping re-reads and rewrites the whole JSON file for
+    every created resource, which is O(N^2) I/O over a restore. The store
+    collects additions in memory and merges them into the file in a single
+    atomic write when flush() is called.
+    """
+
+    def __init__(self, storage_file: str = 'resource_mapping.json') -> None:
+        self.storage_file = storage_file
+        self._pending: Dict[str, Dict[str, Dict[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, instance_url: str, resource_type: str, resource_id: str, resource_name: str) -> None:
+        """Record a resource mapping without touching disk.
+
+        Args:
+            instance_url (str): URL of the n8n instance.
+            resource_type (str): Type of resource (workflows, credentials, projects).
+            resource_id (str): ID of the resource.
+            resource_name (str): Name of the resource.
+        """
+        with self._lock:
+            instance = self._pending.setdefault(instance_url, {
                 'workflows': {},
                 'credentials': {},
                 'projects': {}
-            }
+            })
+            instance[resource_type][resource_id] = resource_name
 
-        mappings[instance_url][resource_type][resource_id] = resource_name
+    def flush(self) -> None:
+        """Merge all pending mappings into the storage file in one write."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
 
-        with open(storage_file, 'w') as f:
-            json.dump(mappings, f, indent=2)
+        if not pending:
+            return
 
-    except Exception as e:
-        print_error(f"Failed to save resource mapping: {str(e)}")
+        try:
+            with _RESOURCE_MAPPING_LOCK:
+                mappings = _read_mappings_cached(self.storage_file)
+
+                for instance_url, resources in pending.items():
+                    instance = mappings.setdefault(instance_url, {
+                        'workflows': {},
+                        'credentials': {},
+                        'projects': {}
+                    })
+                    for resource_type, entries in resources.items():
+                        instance.setdefault(resource_type, {}).update(entries)
+
+                _write_mappings_atomic(mappings, self.storage_file)
+
+        except Exception as e:
+            print_error(f"Failed to flush resource mappings: {str(e)}")
 
 def get_instance_resources(instance_url: str) -> Dict:
     """Get all resources for an instance.
@@ -1115,19 +1826,12 @@ def get_instance_resources(instance_url: str) -> Dict:
     """
     storage_file = 'resource_mapping.json'
     try:
-        if os.path.exists(storage_file):
-            with open(storage_file, 'r') as f:
-                mappings = json.load(f)
-                return mappings.get(instance_url, {
-                    'workflows': {},
-                    'credentials': {},
-                    'projects': {}
-                })
-        return {
+        mappings = _read_mappings_cached(storage_file)
+        return mappings.get(instance_url, {
             'workflows': {},
             'credentials': {},
             'projects': {}
-        }
+        })
     except Exception as e:
         print_error(f"Failed to load resource mappings: {str(e)}")
         return {
@@ -1136,5 +1840,113 @@ def get_instance_resources(instance_url: str) -> Dict:
             'projects': {}
         }
 
+def _run_batch_job(job: Dict, servers: Dict) -> bool:
+    """Execute one batch job against its server without prompting.
+
+    Args:
+        job (Dict): Job description with server plus optional op, project,
+            env and backup keys.
+        servers (Dict): Parsed servers.yaml configuration.
+
+    Returns:
+        bool: True if the job completed, False otherwise.
+    """
+    server_key = job.get('server')
+    server_config = servers['servers'].get(server_key)
+    if server_config is None:
+        print_error(f"Unknown server '{server_key}' in batch file")
+        return False
+
+    op = job.get('op', 'backup')
+    api_key = server_config['api_key']
+    base_url = server_config['url']
+    supports_projects = server_config.get('supports_projects', False)
+
+    if not test_api_connection(api_key, base_url):
+        return False
+
+    project = {'id': None, 'name': 'default'}
+    if supports_projects:
+        project_name = job.get('project')
+        if not project_name:
+            print_error(f"Job for '{server_key}' is missing the required 'project' key "
+                        "(the server has supports_projects enabled)")
+            return False
+        projects = get_all_projects(api_key, base_url)
+        project = next((p for p in projects if p['name'] == project_name), None)
+        if project is None:
+            print_error(f"Project '{project_name}' not found on {server_key}")
+            return False
+
+    if op == 'backup':
+        perform_backup(api_key, base_url, project, supports_projects, server_key)
+    elif op == 'restore':
+        perform_restore(api_key, base_url, project, supports_projects,
+                        job.get('env', 'development'),
+                        backup_name=job.get('backup', 'latest'))
+    elif op == 'cleanup':
+        perform_cleanup(api_key, base_url, project, confirm=False)
+    else:
+        print_error(f"Unknown op '{op}' in batch file")
+        return False
+    return True
+
+def run_batch(batch_file: str, default_op: Optional[str], concurrency: int) -> None:
+    """Run a YAML job list without any interactive prompts.
+
+    Each job is a mapping with a server key from servers.yaml plus
+    optional op (backup/restore/cleanup), project (name), env
+    (production/development) and backup (directory name or 'latest').
+    Jobs run concurrently up to the given bound, so N servers no longer
+    serialize on human round-trips.
+
+    Args:
+        batch_file (str): Path of the YAML job list.
+        default_op (Optional[str]): Operation for jobs that omit one.
+        concurrency (int): Number of jobs to run at once.
+    """
+    if not validate_configs():
+        sys.exit(1)
+    servers = load_server_config()
+
+    try:
+        with open(batch_file, 'r') as f:
+            jobs = yaml.load(f, Loader=_YamlLoader) or []
+    except Exception as e:
+        print_error(f"Error loading batch file {batch_file}: {str(e)}")
+        sys.exit(1)
+
+    if default_op:
+        for job in jobs:
+            job.setdefault('op', default_op)
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(_run_batch_job, job, servers) for job in jobs]
+        for future in as_completed(futures):
+            try:
+                if not future.result():
+                    failed += 1
+            except Exception as e:
+                failed += 1
+                print_error(f"Batch job failed: {str(e)}")
+
+    print_summary("Batch Complete")
+    print(f"Jobs: {len(jobs) - failed} succeeded, {failed} failed")
+    if failed:
+        sys.exit(1)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="n8n workflow migration tool")
+    parser.add_argument('--batch', metavar='CONFIG',
+                        help="run a YAML job list non-interactively and exit")
+    parser.add_argument('--op', choices=['backup', 'restore', 'cleanup'],
+                        help="default operation for batch jobs that omit one")
+    parser.add_argument('--concurrency', type=int, default=2,
+                        help="number of batch jobs to run at once (default: 2)")
+    args = parser.parse_args()
+
+    if args.batch:
+        run_batch(args.batch, args.op, args.concurrency)
+    else:
+        main()
\ No newline at end of file